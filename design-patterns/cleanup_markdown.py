@@ -3,107 +3,147 @@
 Cleanup script to remove Russian language content and EN: prefixes from generated markdown files
 """
 
+import io
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-class MarkdownCleaner:
-    def __init__(self):
-        self.base_dir = Path(r"C:\Programs\PythonTraining\ANS_DesignPatterns_MCP\design-patterns")
-        self.processed_files = []
-        
-    def clean_content(self, content):
+# Precompiled patterns used by the content cleaners
+_SKIP_KEYWORDS = re.compile('Назначение:|Паттерн|Конкретные|Абстрактная Фабрика|объектов')
+_CYRILLIC_CHAR = re.compile(r'[А-Яа-я]')
+_MULTI_BLANK = re.compile(r'\n(?:[ \t]*\n){2,}')  # [ \t] rather than \s, so no overlap with \n
+
+def _clean_line(line):
+    """Remove EN:/RU: markers and Russian text from a non-blank line"""
+    # Remove EN: prefixes along with the whitespace around them
+    if 'EN:' in line:
+        parts = line.split('EN:')
+        line = ''.join([parts[0].rstrip()] +
+                       [part.strip() for part in parts[1:-1]] +
+                       [parts[-1].lstrip()])
+
+    # Remove RU: prefixes and content
+    idx = line.find('RU:')
+    if idx >= 0:
+        line = line[:idx].rstrip()
+
+    # Remove Russian text patterns (Cyrillic characters); this also covers
+    # every specific Russian phrase, since each one contains Cyrillic letters
+    if not line.isascii():
+        match = _CYRILLIC_CHAR.search(line)
+        if match:
+            line = line[:match.start()]
+
+    return line
+
+def _make_cleaner(section_starts, empty_comments):
+    """Build a content cleaner for one file type.
+    
+    section_starts are the line prefixes that end a skipped Russian section and
+    empty_comments the comment markers dropped when nothing else is left on a line.
+    """
+    def clean_content(content):
         """Clean content by removing Russian text and EN: prefixes"""
-        lines = content.split('\n')
-        cleaned_lines = []
+        # Stream lines into a buffer rather than building split/cleaned line lists;
+        # StringIO splits on '\n' only, matching content.split('\n')
+        buf = io.StringIO()
+        sep = ''
         skip_until_next_section = False
-        
-        for i, line in enumerate(lines):
-            original_line = line
-            
+
+        for line in io.StringIO(content):
+            if line.endswith('\n'):
+                line = line[:-1]
+
             # Skip lines that are primarily Russian content
-            if any(keyword in line for keyword in ['RU:', 'Назначение:', 'Паттерн', 'Конкретные', 'Абстрактная Фабрика', 'объектов']):
+            # (the keywords other than RU: are Cyrillic, so ASCII lines only need one test)
+            if 'RU:' in line or (not line.isascii() and _SKIP_KEYWORDS.search(line)):
                 skip_until_next_section = True
                 continue
-                
+
             # Stop skipping when we hit an EN: line or structural element
             if skip_until_next_section:
-                if (line.strip().startswith('EN:') or 
-                    line.strip().startswith('class ') or 
-                    line.strip().startswith('def ') or
-                    line.strip().startswith('from ') or
-                    line.strip().startswith('import ') or
-                    line.strip().startswith('#include') or
-                    line.strip().startswith('*/') or
-                    line.strip() == '' or
-                    '```' in line):
+                stripped = line.strip()
+                if not stripped or stripped.startswith(section_starts) or '```' in line:
                     skip_until_next_section = False
                 else:
                     continue
-            
-            # Remove EN: prefixes
-            line = re.sub(r'\s*EN:\s*', '', line)
-            
-            # Remove RU: prefixes and content
-            line = re.sub(r'\s*RU:\s*.*', '', line)
-            
-            # Remove Russian text patterns (Cyrillic characters)
-            line = re.sub(r'[А-Яа-я]+.*', '', line)
-            
-            # Remove specific Russian words and phrases
-            russian_patterns = [
-                r'Назначение:.*',
-                r'Паттерн.*',
-                r'собственный класс.*',
-                r'исполнения программы.*',
-                r'Конкретные.*',
-                r'Абстрактная.*',
-                r'объектов.*',
-                r'интерфейс.*',
-                r'алгоритмов.*'
-            ]
-            
-            for pattern in russian_patterns:
-                line = re.sub(pattern, '', line, flags=re.IGNORECASE)
-            
-            # Clean up extra whitespace and empty comment lines
-            line = re.sub(r'^\s*\*\s*$', '', line)  # Remove empty comment lines
-            line = re.sub(r'^\s*//\s*$', '', line)  # Remove empty C++ comment lines
-            line = re.sub(r'^\s*#\s*$', '', line)   # Remove empty Python comment lines
-            
-            # Don't add completely empty lines that result from cleaning
-            if line.strip() or original_line.strip() == '':
-                cleaned_lines.append(line)
+
+            # Blank lines from the source are kept as they are; others are cleaned
+            if line.strip():
+                line = _clean_line(line)
+
+                # Don't add lines left empty by cleaning, or empty comment lines
+                stripped = line.strip()
+                if not stripped or stripped in empty_comments:
+                    continue
+
+            buf.write(sep)
+            buf.write(line)
+            sep = '\n'
+
+        # A trailing newline ends in an empty last line, which is always kept
+        if content.endswith('\n'):
+            buf.write(sep)
+
+        # Clean up multiple consecutive empty lines
+        return _MULTI_BLANK.sub('\n\n', buf.getvalue())  # Replace multiple empty lines with double
+
+    return clean_content
+
+# Cleaners specialized by file suffix; markdown embeds both C++ and Python
+# samples, so it keeps the full set of section prefixes and comment markers
+_CLEANERS = {
+    '.cpp': _make_cleaner(('EN:', 'class ', '#include', '*/'), frozenset(['*', '//'])),
+    '.py': _make_cleaner(('EN:', 'class ', 'def ', 'from ', 'import '), frozenset(['#'])),
+    '.md': _make_cleaner(('EN:', 'class ', 'def ', 'from ', 'import ', '#include', '*/'),
+                         frozenset(['*', '//', '#'])),
+}
+
+def _clean_one(file_path):
+    """Clean a single file; returns (file name, changed, status message).
+    
+    Kept at module level so it can be dispatched to worker processes.
+    """
+    try:
+        raw = file_path.read_bytes()
+        
+        # Skip files with no EN:/RU: markers and no Cyrillic text
+        # (UTF-8 lead bytes 0xD0/0xD1), e.g. files cleaned on a previous run
+        if not (b'EN:' in raw or b'RU:' in raw or b'\xd0' in raw or b'\xd1' in raw):
+            return file_path.name, False, f"[-] Skipped {file_path.name} (nothing to clean)"
         
-        # Join lines and clean up multiple consecutive empty lines
-        content = '\n'.join(cleaned_lines)
-        content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)  # Replace multiple empty lines with double
+        # Normalize line endings the same way a text-mode read would
+        content = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        clean_content = _CLEANERS.get(file_path.suffix, _CLEANERS['.md'])
+        cleaned_content = clean_content(content)
         
-        return content
+        # Only write if content changed
+        if cleaned_content != content:
+            file_path.write_text(cleaned_content, encoding='utf-8')
+            return file_path.name, True, f"[OK] Cleaned {file_path.name}"
+        else:
+            return file_path.name, False, f"[-] No changes needed for {file_path.name}"
+            
+    except Exception as e:
+        return file_path.name, False, f"[ERROR] Error processing {file_path.name}: {e}"
+
+class MarkdownCleaner:
+    def __init__(self):
+        self.base_dir = Path(r"C:\Programs\PythonTraining\ANS_DesignPatterns_MCP\design-patterns")
+        self.processed_files = []
+        
+    def clean_content(self, content):
+        """Clean content by removing Russian text and EN: prefixes"""
+        return _CLEANERS['.md'](content)
     
     def clean_file(self, file_path):
         """Clean a single markdown file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            original_content = content
-            cleaned_content = self.clean_content(content)
-            
-            # Only write if content changed
-            if cleaned_content != original_content:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(cleaned_content)
-                print(f"[OK] Cleaned {file_path.name}")
-                self.processed_files.append(file_path.name)
-                return True
-            else:
-                print(f"[-] No changes needed for {file_path.name}")
-                return False
-                
-        except Exception as e:
-            print(f"[ERROR] Error processing {file_path.name}: {e}")
-            return False
+        name, changed, message = _clean_one(file_path)
+        print(message)
+        if changed:
+            self.processed_files.append(name)
+        return changed
     
     def clean_all_markdown_files(self):
         """Clean all markdown files in the directory"""
@@ -122,15 +162,22 @@ class MarkdownCleaner:
             print("No markdown files found to clean.")
             return
         
+        markdown_files.sort()
         print(f"Found {len(markdown_files)} markdown files to process:")
-        for f in sorted(markdown_files):
+        for f in markdown_files:
             print(f"  - {f.name}")
         print()
         
+        # Files are independent and the work is CPU-bound, so spread them over
+        # worker processes; map() keeps results in submission order, so
+        # processed_files comes out already sorted
         cleaned_count = 0
-        for file_path in sorted(markdown_files):
-            if self.clean_file(file_path):
-                cleaned_count += 1
+        with ProcessPoolExecutor() as executor:
+            for name, changed, message in executor.map(_clean_one, markdown_files, chunksize=4):
+                print(message)
+                if changed:
+                    self.processed_files.append(name)
+                    cleaned_count += 1
         
         print(f"\nCleanup completed!")
         print(f"Files processed: {len(markdown_files)}")
@@ -138,7 +185,7 @@ class MarkdownCleaner:
         
         if self.processed_files:
             print(f"\nModified files:")
-            for filename in sorted(self.processed_files):
+            for filename in self.processed_files:
                 print(f"  [OK] {filename}")
 
 if __name__ == "__main__":
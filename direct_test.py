@@ -6,11 +6,31 @@ This script directly reads design pattern files from the design-patterns directo
 and prints their contents to verify they can be accessed correctly.
 """
 
+import functools
 import json
 import os
 import sys
+from pathlib import Path
 from typing import Dict, Any, Optional
 
+# Default pattern directory
+DEFAULT_PATTERN_DIR = os.path.join(os.path.dirname(__file__), "design-patterns")
+
+@functools.lru_cache(maxsize=1)
+def _load_config() -> Dict[str, Any]:
+    """Load config.json once and reuse it for every pattern read.
+    
+    Returns:
+        Dict[str, Any]: The configuration data, or an empty dict if unavailable.
+    """
+    config_path = os.path.join(os.path.dirname(__file__), 'config.json')
+    if os.path.exists(config_path):
+        try:
+            return json.loads(Path(config_path).read_bytes())
+        except Exception as e:
+            print(f"Error loading config: {e}")
+    return {}
+
 def read_design_pattern(pattern_name: str) -> Optional[str]:
     """Read a design pattern file directly.
     
@@ -20,34 +40,21 @@ def read_design_pattern(pattern_name: str) -> Optional[str]:
     Returns:
         str: The content of the design pattern file, or None if not found.
     """
-    # Default pattern directory
-    pattern_dir = os.path.join(os.path.dirname(__file__), "design-patterns")
-    
-    # Try to load from config.json if available
-    config_path = os.path.join(os.path.dirname(__file__), 'config.json')
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-                if 'design_patterns_dir' in config_data:
-                    pattern_dir = config_data['design_patterns_dir']
-        except Exception as e:
-            print(f"Error loading config: {e}")
+    pattern_dir = _load_config().get('design_patterns_dir', DEFAULT_PATTERN_DIR)
     
     # Build the full path to the pattern file
     filename = os.path.join(pattern_dir, f"{pattern_name}.md")
     
     print(f"Looking for pattern file: {filename}")
     
-    if not os.path.exists(filename):
-        print(f"Pattern file not found: {filename}")
-        return None
-    
     try:
         with open(filename, "r", encoding="utf-8") as f:
             content = f.read()
         print(f"Successfully read pattern: {pattern_name}")
         return content
+    except FileNotFoundError:
+        print(f"Pattern file not found: {filename}")
+        return None
     except Exception as e:
         print(f"Error reading pattern file: {e}")
         return None
@@ -10,11 +10,14 @@ Implements the Model Context Protocol (MCP) for integration with Windsurf and ot
 """
 
 import os
+import asyncio
 import logging
+import functools
 from typing import Dict, List, Optional
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from pathlib import Path
 from pydantic import BaseModel
 
 from mcp.server.fastmcp import FastMCP
@@ -40,7 +43,8 @@ class Config(BaseModel):
 class AppContext:
     """Application context for the MCP server."""
     config: Config
-    patterns: List[str]
+    pattern_names: List[str]
+    patterns: Dict[str, str]
 
 
 @asynccontextmanager
@@ -51,16 +55,28 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     logger.info(f"Using pattern directory: {config.design_patterns_dir}")
     
     # List available patterns
-    patterns = []
+    pattern_names = []
     try:
-        patterns = [f.replace('.md', '') for f in os.listdir(config.design_patterns_dir) 
-                   if f.endswith('.md')]
-        logger.info(f"Available patterns: {', '.join(patterns)}")
+        with os.scandir(config.design_patterns_dir) as entries:
+            pattern_paths = {e.name[:-3]: e.path for e in entries
+                             if e.name.endswith('.md') and e.is_file()}
+        pattern_names = list(pattern_paths)
+        logger.info(f"Available patterns: {', '.join(pattern_names)}")
     except Exception as e:
+        pattern_paths = {}
         logger.error(f"Error listing patterns: {e}")
     
+    # Preload pattern contents so requests are served from memory; a file that
+    # cannot be read is left out and served through the disk fallback instead
+    patterns = {}
+    for name, path in pattern_paths.items():
+        try:
+            patterns[name] = Path(path).read_text(encoding="utf-8")
+        except Exception as e:
+            logger.error(f"Error preloading pattern {name}: {e}")
+    
     # Create and yield the application context
-    yield AppContext(config=config, patterns=patterns)
+    yield AppContext(config=config, pattern_names=pattern_names, patterns=patterns)
 
 
 def load_config() -> Config:
@@ -72,9 +88,8 @@ def load_config() -> Config:
     try:
         config_path = os.path.join(os.path.dirname(__file__), 'config.json')
         if os.path.exists(config_path):
-            with open(config_path, 'r', encoding='utf-8') as f:
-                import json
-                config_data = json.load(f)
+            import json
+            config_data = json.loads(Path(config_path).read_bytes())
             logger.info(f"Loaded configuration from {config_path}")
             return Config(**config_data)
     except Exception as e:
@@ -84,6 +99,28 @@ def load_config() -> Config:
     return Config()
 
 
+@functools.lru_cache(maxsize=64)
+def _read_pattern_cached(path: str, mtime_ns: int) -> str:
+    """Read a pattern file, caching its content per path and modification time."""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def read_pattern_file(path: str) -> str:
+    """Read a pattern file, serving unchanged files from an in-memory cache.
+    
+    Args:
+        path: Full path to the pattern markdown file.
+    
+    Returns:
+        str: The content of the pattern file.
+    
+    Raises:
+        FileNotFoundError: If the pattern file does not exist.
+    """
+    return _read_pattern_cached(path, os.stat(path).st_mtime_ns)
+
+
 # Create an MCP server with lifespan
 mcp = FastMCP(
     "ANS Design Patterns", 
@@ -93,7 +130,7 @@ mcp = FastMCP(
 
 
 @mcp.tool(title="Get Design Pattern")
-def get_design_pattern(pattern: str) -> Dict[str, List[Dict[str, str]]]:
+async def get_design_pattern(pattern: str) -> Dict[str, List[Dict[str, str]]]:
     """
     Get documentation for a specific design pattern.
     
@@ -107,27 +144,32 @@ def get_design_pattern(pattern: str) -> Dict[str, List[Dict[str, str]]]:
     app_ctx = ctx.request_context.lifespan_context
     config = app_ctx.config
     
+    text = app_ctx.patterns.get(pattern)
+    if text is not None:
+        logger.info(f"Serving preloaded pattern: {pattern}")
+        return {"content": [{"type": "markdown", "text": text}]}
+    
+    # Fall back to disk for patterns added since startup, reading in a worker
+    # thread so the event loop is not blocked
     pattern_dir = config.design_patterns_dir
     filename = os.path.join(pattern_dir, f"{pattern}.md")
     
     logger.info(f"Looking for pattern file: {filename}")
     
-    if not os.path.exists(filename):
-        logger.warning(f"Pattern file not found: {filename}")
-        return {"content": [{"type": "text", "text": f'Pattern "{pattern}" not found.'}]}
-
     try:
-        with open(filename, "r", encoding="utf-8") as f:
-            text = f.read()
+        text = await asyncio.to_thread(read_pattern_file, filename)
         logger.info(f"Successfully read pattern: {pattern}")
         return {"content": [{"type": "markdown", "text": text}]}
+    except FileNotFoundError:
+        logger.warning(f"Pattern file not found: {filename}")
+        return {"content": [{"type": "text", "text": f'Pattern "{pattern}" not found.'}]}
     except Exception as e:
         logger.error(f"Error reading pattern file: {e}")
         return {"content": [{"type": "text", "text": f'Error reading pattern "{pattern}": {str(e)}'}]}
 
 
 @mcp.resource("design-pattern://{pattern_name}", title="Design Pattern")
-def design_pattern_resource(pattern_name: str) -> str:
+async def design_pattern_resource(pattern_name: str) -> str:
     """
     Get the content of a specific design pattern.
     
@@ -141,15 +183,18 @@ def design_pattern_resource(pattern_name: str) -> str:
     app_ctx = ctx.request_context.lifespan_context
     config = app_ctx.config
     
+    text = app_ctx.patterns.get(pattern_name)
+    if text is not None:
+        return text
+    
+    # Fall back to disk for patterns added since startup
     pattern_dir = config.design_patterns_dir
     filename = os.path.join(pattern_dir, f"{pattern_name}.md")
     
-    if not os.path.exists(filename):
-        return f"Pattern '{pattern_name}' not found."
-    
     try:
-        with open(filename, "r", encoding="utf-8") as f:
-            return f.read()
+        return await asyncio.to_thread(read_pattern_file, filename)
+    except FileNotFoundError:
+        return f"Pattern '{pattern_name}' not found."
     except Exception as e:
         logger.error(f"Error reading pattern file: {e}")
         return f"Error reading pattern '{pattern_name}': {str(e)}"
@@ -165,16 +210,15 @@ def list_patterns() -> str:
     """
     ctx = mcp.get_context()
     app_ctx = ctx.request_context.lifespan_context
-    patterns = app_ctx.patterns
+    patterns = app_ctx.pattern_names
     
     if not patterns:
         return "No design patterns available."
     
-    result = "# Available Design Patterns\n\n"
-    for pattern in patterns:
-        result += f"- [{pattern.capitalize()}](design-pattern://{pattern})\n"
+    lines = ["# Available Design Patterns", ""]
+    lines += [f"- [{pattern.capitalize()}](design-pattern://{pattern})" for pattern in patterns]
     
-    return result
+    return "\n".join(lines) + "\n"
 
 
 if __name__ == "__main__":
@@ -8,7 +8,9 @@ This client directly reads the design pattern files to verify they exist and are
 
 import os
 import json
+import functools
 import logging
+from pathlib import Path
 from typing import List, Optional
 
 # Setup logging
@@ -18,6 +20,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger("test_client")
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> dict:
     """Load configuration from config.json if available.
     
@@ -27,8 +30,7 @@ def load_config() -> dict:
     try:
         config_path = os.path.join(os.path.dirname(__file__), 'config.json')
         if os.path.exists(config_path):
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            config_data = json.loads(Path(config_path).read_bytes())
             logger.info(f"Loaded configuration from {config_path}")
             return config_data
     except Exception as e:
@@ -50,8 +52,9 @@ def get_available_patterns(pattern_dir: str) -> List[str]:
         List[str]: A list of available pattern names (without .md extension).
     """
     try:
-        patterns = [f.replace('.md', '') for f in os.listdir(pattern_dir) 
-                   if f.endswith('.md')]
+        with os.scandir(pattern_dir) as entries:
+            patterns = [e.name[:-3] for e in entries
+                        if e.name.endswith('.md') and e.is_file()]
         return patterns
     except Exception as e:
         logger.error(f"Error listing patterns: {e}")
@@ -69,14 +72,13 @@ def read_pattern(pattern_name: str, pattern_dir: str) -> Optional[str]:
     """
     file_path = os.path.join(pattern_dir, f"{pattern_name}.md")
     try:
-        if not os.path.exists(file_path):
-            logger.warning(f"Pattern file not found: {file_path}")
-            return None
-        
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         logger.info(f"Successfully read pattern: {pattern_name}")
         return content
+    except FileNotFoundError:
+        logger.warning(f"Pattern file not found: {file_path}")
+        return None
     except Exception as e:
         logger.error(f"Error reading pattern file: {e}")
         return None